@@ -2,10 +2,12 @@
 
 __version__ = "1.0.0"
 
-from .models import Task, DEFAULT_DIR, DEFAULT_LIST, list_path
-from .storage import read_file, write_file, get_available_lists
+from .models import Status, Task, DEFAULT_DIR, DEFAULT_LIST, list_path
+from .storage import read_file, read_file_mmap, write_file, get_available_lists
 from .core import (
+    TaskIndex,
     first_live_index,
+    index_tasks,
     last_dotted_index,
     previous_dotted_above,
     clear_all_dots,
@@ -14,14 +16,18 @@ from .core import (
 )
 
 __all__ = [
+    "Status",
     "Task",
     "DEFAULT_DIR",
     "DEFAULT_LIST",
     "list_path",
     "read_file",
+    "read_file_mmap",
     "write_file",
     "get_available_lists",
+    "TaskIndex",
     "first_live_index",
+    "index_tasks",
     "last_dotted_index",
     "previous_dotted_above",
     "clear_all_dots",
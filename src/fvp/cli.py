@@ -5,46 +5,57 @@ import os
 import sys
 from typing import List, Optional
 
-from .models import Task, DEFAULT_DIR, DEFAULT_LIST, list_path
+from .models import Status, Task, DEFAULT_DIR, DEFAULT_LIST, list_path
 from .storage import (
+    append_task,
+    clean_file,
+    count_tasks,
     read_file,
+    read_file_mmap,
     write_file,
     ensure_file_exists,
     ensure_dir_exists,
     get_available_lists,
 )
 from .core import (
-    first_live_index,
-    last_dotted_index,
-    previous_dotted_above,
     clear_all_dots,
     finish_effects_after_action,
+    index_tasks,
     shuffle_tasks,
 )
 
 
+_MARKERS = ("[ ]", "[.]", "[x]")  # indexed by Status
+_COMPARE_PROMPT = "Do you want to do [{i}] {it} more than [{b}] {bt}?"
+
+
 def print_list(
     tasks: List[Task], show_done: bool, last_did: Optional[int]
 ) -> None:
     """Print task list with markers and flags."""
-    root = first_live_index(tasks)
-    prev_dot = previous_dotted_above(tasks, last_did) if last_did else None
+    idx = index_tasks(tasks)
+    root = idx.first_live
+    prev_dot = idx.previous_dotted_above(last_did) if last_did else None
+    ld = last_did or 0
 
+    buf = []
     for i, t in enumerate(tasks, start=1):
-        if not show_done and t.status == "done":
+        if not show_done and t.status == Status.DONE:
             continue
-        marker = (
-            "[ ]" if t.status == "open" else "[.]" if t.status == "dotted" else "[x]"
-        )
-        flags = []
-        if root == i:
-            flags.append("ROOT")
-        if last_did and (i == last_did):
-            flags.append("JUST-DID")
-        if prev_dot and (i == prev_dot):
-            flags.append("BENCHMARK")
-        suffix = f"  <- {', '.join(flags)}" if flags else ""
-        print(f"{i:>3}. {marker} {t.text}{suffix}")
+        marker = _MARKERS[t.status]
+        if i == root or i == ld or i == prev_dot:
+            flags = []
+            if root == i:
+                flags.append("ROOT")
+            if i == ld:
+                flags.append("JUST-DID")
+            if i == prev_dot:
+                flags.append("BENCHMARK")
+            suffix = f"  <- {', '.join(flags)}"
+        else:
+            suffix = ""
+        buf.append(f"{i:>3}. {marker} {t.text}{suffix}\n")
+    sys.stdout.write("".join(buf))
 
 
 def prompt_yes_no(question: str) -> bool:
@@ -57,7 +68,7 @@ def prompt_yes_no(question: str) -> bool:
 
 
 def cmd_list(args: argparse.Namespace) -> None:
-    last_did, tasks = read_file(args.file)
+    last_did, tasks = read_file_mmap(args.file)
     if not tasks:
         print("(no tasks yet)")
         return
@@ -65,10 +76,10 @@ def cmd_list(args: argparse.Namespace) -> None:
 
 
 def cmd_add(args: argparse.Namespace) -> None:
-    last_did, tasks = read_file(args.file)
-    tasks.append(Task(text=args.text.strip(), status="open"))
-    write_file(args.file, last_did, tasks)
-    print(f"Added: {args.text.strip()}")
+    text = args.text.strip()
+    # Appending never touches the header, so skip the read-modify-rewrite.
+    append_task(args.file, Task(text=text, status=Status.OPEN))
+    print(f"Added: {text}")
 
 
 def cmd_edit(args: argparse.Namespace) -> None:
@@ -76,7 +87,9 @@ def cmd_edit(args: argparse.Namespace) -> None:
     idx = args.index
     if idx < 1 or idx > len(tasks):
         sys.exit("Index out of range.")
-    tasks[idx - 1].text = args.text.strip()
+    t = tasks[idx - 1]
+    t.text = args.text.strip()
+    t.text_lower = t.text.lower()
     write_file(args.file, last_did, tasks)
     print(f"Edited {idx}.")
 
@@ -86,7 +99,7 @@ def cmd_done(args: argparse.Namespace) -> None:
     idx = args.index
     if idx < 1 or idx > len(tasks):
         sys.exit("Index out of range.")
-    tasks[idx - 1].status = "done"
+    tasks[idx - 1].status = Status.DONE
     last_did, reset = finish_effects_after_action(tasks, idx)
     write_file(args.file, last_did, tasks)
     print(f"Marked done: {idx}. {'(root finished -> dots reset)' if reset else ''}")
@@ -99,8 +112,8 @@ def cmd_stop(args: argparse.Namespace) -> None:
     if idx < 1 or idx > len(tasks):
         sys.exit("Index out of range.")
     text = tasks[idx - 1].text
-    tasks[idx - 1].status = "done"
-    tasks.append(Task(text=text, status="open"))
+    tasks[idx - 1].status = Status.DONE
+    tasks.append(Task(text=text, status=Status.OPEN))
     last_did, reset = finish_effects_after_action(tasks, idx)
     write_file(args.file, last_did, tasks)
     print(
@@ -111,18 +124,15 @@ def cmd_stop(args: argparse.Namespace) -> None:
 
 def cmd_reset(args: argparse.Namespace) -> None:
     last_did, tasks = read_file(args.file)
-    clear_all_dots(tasks)
-    last_did = None
-    write_file(args.file, last_did, tasks)
+    changed = clear_all_dots(tasks)
+    if changed or last_did is not None:
+        write_file(args.file, None, tasks)
     print("Cleared dots and scanning state.")
 
 
 def cmd_clean(args: argparse.Namespace) -> None:
     """Remove crossed-out lines."""
-    last_did, tasks = read_file(args.file)
-    tasks = [t for t in tasks if t.status != "done"]
-    last_did = None
-    write_file(args.file, last_did, tasks)
+    clean_file(args.file)
     print("Removed all crossed-out tasks. (Scanning state reset.)")
 
 
@@ -142,16 +152,14 @@ def cmd_lists(args: argparse.Namespace) -> None:
     print(f"Available lists in {DEFAULT_DIR}/:\n")
     for name in lists:
         path = list_path(name)
-        _, tasks = read_file(path)
-        live_count = sum(1 for t in tasks if t.status != "done")
-        total_count = len(tasks)
+        live_count, total_count = count_tasks(path)
         print(f"  {name:20} {live_count:>3} live / {total_count:>3} total")
 
 
 def cmd_shuffle(args: argparse.Namespace) -> None:
     """Shuffle live tasks randomly."""
     _, tasks = read_file(args.file)
-    live_count = sum(1 for t in tasks if t.status != "done")
+    live_count = sum(1 for t in tasks if t.status != Status.DONE)
     if live_count < 2:
         print("Not enough live tasks to shuffle.")
         return
@@ -163,89 +171,90 @@ def cmd_shuffle(args: argparse.Namespace) -> None:
 def cmd_next(args: argparse.Namespace) -> None:
     """Interactive scan to find the next task."""
     last_did, tasks = read_file(args.file)
-    if not tasks or first_live_index(tasks) is None:
+    ix = index_tasks(tasks)
+    if not tasks or ix.first_live is None:
         print("(no live tasks)")
         return
 
+    orig_last = last_did
+    dirty = False
+
     if last_did and (last_did < 1 or last_did > len(tasks)):
         last_did = None
 
+    # Non-interactive fast paths: pre-fetched answers avoid a TTY
+    # round-trip (and input() call) per task.
+    if getattr(args, "yes_all", False):
+        def ask(question: str) -> bool:
+            return True
+    elif getattr(args, "answers", None):
+        answers = iter(args.answers.read().split())
+
+        def ask(question: str) -> bool:
+            a = next(answers, "n")
+            return a.lower() in ("y", "yes")
+    else:
+        ask = prompt_yes_no
+
     def show_task(i: int) -> str:
         return f"[{i}] {tasks[i - 1].text}"
 
-    def ensure_root_dotted_local() -> Optional[int]:
-        ridx = first_live_index(tasks)
-        if ridx is None:
-            return None
-        if tasks[ridx - 1].status != "dotted":
-            tasks[ridx - 1].status = "dotted"
-        return ridx
-
     if last_did:
-        prev_dot = previous_dotted_above(tasks, last_did)
+        prev_dot = ix.previous_dotted_above(last_did)
         if prev_dot is None:
             last_did = None
 
     if not last_did:
-        root_idx = ensure_root_dotted_local()
-        if root_idx is None:
-            print("(no live tasks)")
-            return
-        benchmark_idx = last_dotted_index(tasks) or root_idx
-        start_from = benchmark_idx + 1
-        i = start_from
-        while i <= len(tasks):
-            t = tasks[i - 1]
-            if t.status == "done":
-                i += 1
+        root_idx = ix.first_live
+        if tasks[root_idx - 1].status != Status.DOTTED:
+            tasks[root_idx - 1].status = Status.DOTTED
+            dirty = True
+        benchmark_idx = ix.last_dotted or root_idx
+        # Maintain the benchmark locally: it only moves when a task is
+        # dotted, so there is no need to rescan the list each iteration.
+        current_bench = benchmark_idx
+        bench_txt = tasks[current_bench - 1].text
+        T = tasks  # local bindings keep the loop on LOAD_FAST
+        for i in range(benchmark_idx + 1, len(T) + 1):
+            t = T[i - 1]
+            if t.status == Status.DONE:
                 continue
-            current_bench = last_dotted_index(tasks)
-            bench_txt = tasks[current_bench - 1].text if current_bench else "(none)"
-            if prompt_yes_no(
-                f"Do you want to do {show_task(i)} more than [{current_bench}] {bench_txt}?"
-            ):
-                if t.status != "dotted":
-                    t.status = "dotted"
-            i += 1
-
-        to_do = last_dotted_index(tasks)
-        write_file(args.file, last_did, tasks)
-        if to_do:
-            print(f"\n-> Do this now: {show_task(to_do)}")
+            if ask(_COMPARE_PROMPT.format(i=i, it=t.text, b=current_bench, bt=bench_txt)):
+                if t.status != Status.DOTTED:
+                    t.status = Status.DOTTED
+                    dirty = True
+                current_bench = i
+                bench_txt = t.text
+
+        # current_bench tracked the lowest dot through the scan, so it is
+        # the "do now" target without another pass.
+        if dirty or last_did != orig_last:
+            write_file(args.file, last_did, tasks)
+        print(f"\n-> Do this now: {show_task(current_bench)}")
         return
 
-    benchmark_idx = previous_dotted_above(tasks, last_did)
-    if benchmark_idx is None:
-        clear_all_dots(tasks)
-        last_did = None
-        write_file(args.file, last_did, tasks)
-        print("Dots were stale; reset. Run `next` again.")
-        return
+    benchmark_idx = prev_dot
 
-    i = last_did + 1
     dotted_any = False
-    while i <= len(tasks):
-        t = tasks[i - 1]
-        if t.status == "done":
-            i += 1
+    bench_txt = tasks[benchmark_idx - 1].text
+    T = tasks
+    for i in range(last_did + 1, len(T) + 1):
+        t = T[i - 1]
+        if t.status == Status.DONE:
             continue
-        bench_txt = tasks[benchmark_idx - 1].text
-        if prompt_yes_no(
-            f"Do you want to do {show_task(i)} more than [{benchmark_idx}] {bench_txt}?"
-        ):
-            if t.status != "dotted":
-                t.status = "dotted"
+        if ask(_COMPARE_PROMPT.format(i=i, it=t.text, b=benchmark_idx, bt=bench_txt)):
+            if t.status != Status.DOTTED:
+                t.status = Status.DOTTED
             benchmark_idx = i
+            bench_txt = t.text
             dotted_any = True
-        i += 1
 
-    write_file(args.file, last_did, tasks)
+    if dotted_any or last_did != orig_last:
+        write_file(args.file, last_did, tasks)
 
-    if dotted_any:
-        to_do = last_dotted_index(tasks)
-        print(f"\n-> Do this now: {show_task(to_do)}")
-    else:
-        print(f"\n-> Do this now: {show_task(benchmark_idx)}")
+    # benchmark_idx already points at the lowest dot (or the unchanged
+    # benchmark when nothing was dotted).
+    print(f"\n-> Do this now: {show_task(benchmark_idx)}")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -274,33 +283,41 @@ def build_parser() -> argparse.ArgumentParser:
 
     s_add = sub.add_parser("add", help="Append a new task")
     s_add.add_argument("text", help="Task text, quoted if it has spaces")
-    s_add.set_defaults(func=cmd_add)
+    s_add.set_defaults(func=cmd_add, writes_file=True)
 
     s_edit = sub.add_parser("edit", help="Edit task text in place")
     s_edit.add_argument("index", type=int, help="Task index from `list`")
     s_edit.add_argument("text", help="New text")
-    s_edit.set_defaults(func=cmd_edit)
+    s_edit.set_defaults(func=cmd_edit, writes_file=True)
 
     s_next = sub.add_parser("next", help="Interactive scan to recommend the next task")
-    s_next.set_defaults(func=cmd_next)
+    s_next.add_argument(
+        "--answers",
+        type=argparse.FileType("r"),
+        help="Read y/n answers from a file instead of prompting",
+    )
+    s_next.add_argument(
+        "--yes-all", action="store_true", help="Answer yes to every comparison"
+    )
+    s_next.set_defaults(func=cmd_next, writes_file=True)
 
     s_done = sub.add_parser("done", help="Mark a task done ([x])")
     s_done.add_argument("index", type=int)
-    s_done.set_defaults(func=cmd_done)
+    s_done.set_defaults(func=cmd_done, writes_file=True)
 
     s_stop = sub.add_parser("stop", help="Stop for now: cross out & re-add at bottom")
     s_stop.add_argument("index", type=int)
-    s_stop.set_defaults(func=cmd_stop)
+    s_stop.set_defaults(func=cmd_stop, writes_file=True)
 
     s_bump = sub.add_parser("bump", help="Alias of `stop`")
     s_bump.add_argument("index", type=int)
-    s_bump.set_defaults(func=cmd_stop)
+    s_bump.set_defaults(func=cmd_stop, writes_file=True)
 
     s_reset = sub.add_parser("reset", help="Wipe all dots and scanning state")
-    s_reset.set_defaults(func=cmd_reset)
+    s_reset.set_defaults(func=cmd_reset, writes_file=True)
 
     s_clean = sub.add_parser("clean", help="Remove all crossed-out lines ([x])")
-    s_clean.set_defaults(func=cmd_clean)
+    s_clean.set_defaults(func=cmd_clean, writes_file=True)
 
     s_path = sub.add_parser("path", help="Show the absolute path to the tasks file")
     s_path.set_defaults(func=cmd_path)
@@ -309,7 +326,7 @@ def build_parser() -> argparse.ArgumentParser:
     s_lists.set_defaults(func=cmd_lists)
 
     s_shuffle = sub.add_parser("shuffle", help="Randomly reorder live tasks")
-    s_shuffle.set_defaults(func=cmd_shuffle)
+    s_shuffle.set_defaults(func=cmd_shuffle, writes_file=True)
 
     return p
 
@@ -333,9 +350,6 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    # Ensure the ~/.fvp directory exists
-    ensure_dir_exists()
-
     # Handle 'lists' command specially (no file needed)
     if args.cmd == "lists":
         args.func(args)
@@ -346,6 +360,7 @@ def main() -> None:
 
     if args.cmd is None:
         # No subcommand: launch TUI
+        ensure_dir_exists()
         from .tui import main as tui_main
 
         if file_path:
@@ -360,7 +375,11 @@ def main() -> None:
         if file_path is None:
             # Use default list
             file_path = list_path(DEFAULT_LIST)
-        ensure_file_exists(file_path)
+        # Read-only commands (list/path) skip the directory/file setup
+        # syscalls; the mmap read path handles a missing file gracefully.
+        if getattr(args, "writes_file", False):
+            ensure_dir_exists()
+            ensure_file_exists(file_path)
         args.file = file_path
         args.func(args)
 
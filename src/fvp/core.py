@@ -1,15 +1,43 @@
 """FVP algorithm helpers (pure functions, no I/O)."""
 
 import random
+from bisect import bisect_left
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from .models import Task
+from .models import Status, Task
+
+
+@dataclass
+class TaskIndex:
+    """Status positions collected in a single pass over the task list."""
+
+    first_live: Optional[int]
+    last_dotted: Optional[int]
+    dotted: List[int]  # 1-based indices of dotted tasks, ascending
+
+    def previous_dotted_above(self, index: int) -> Optional[int]:
+        """Nearest dotted index strictly above `index`, via bisect."""
+        j = bisect_left(self.dotted, index)
+        return self.dotted[j - 1] if j > 0 else None
+
+
+def index_tasks(tasks: List[Task]) -> TaskIndex:
+    """Build a TaskIndex in one O(n) pass instead of repeated scans."""
+    first_live = None
+    dotted: List[int] = []
+    for i, t in enumerate(tasks, start=1):
+        if first_live is None and t.status != Status.DONE:
+            first_live = i
+        if t.status == Status.DOTTED:
+            dotted.append(i)
+    return TaskIndex(first_live, dotted[-1] if dotted else None, dotted)
 
 
 def first_live_index(tasks: List[Task]) -> Optional[int]:
     """Return the 1-based index of the first non-done task, or None."""
     for i, t in enumerate(tasks, start=1):
-        if t.status != "done":
+        if t.status != Status.DONE:
             return i
     return None
 
@@ -18,7 +46,7 @@ def last_dotted_index(tasks: List[Task]) -> Optional[int]:
     """Return the 1-based index of the lowest dotted task, or None."""
     idx = None
     for i, t in enumerate(tasks, start=1):
-        if t.status == "dotted":
+        if t.status == Status.DOTTED:
             idx = i
     return idx
 
@@ -26,16 +54,19 @@ def last_dotted_index(tasks: List[Task]) -> Optional[int]:
 def previous_dotted_above(tasks: List[Task], index: int) -> Optional[int]:
     """Find the nearest dotted task strictly above index, or None."""
     for i in range(index - 1, 0, -1):
-        if tasks[i - 1].status == "dotted":
+        if tasks[i - 1].status == Status.DOTTED:
             return i
     return None
 
 
-def clear_all_dots(tasks: List[Task]) -> None:
-    """Reset all dotted tasks to open status."""
+def clear_all_dots(tasks: List[Task]) -> bool:
+    """Reset all dotted tasks to open status; return True if any changed."""
+    changed = False
     for t in tasks:
-        if t.status == "dotted":
-            t.status = "open"
+        if t.status == Status.DOTTED:
+            t.status = Status.OPEN
+            changed = True
+    return changed
 
 
 def finish_effects_after_action(
@@ -48,11 +79,17 @@ def finish_effects_after_action(
 
     Returns (new_last_did, root_cleared).
     """
-    prev_dot = previous_dotted_above(tasks, acted_index)
-    if prev_dot is None:
-        clear_all_dots(tasks)
-        return None, True
-    return acted_index, False
+    for i in range(acted_index - 1, 0, -1):
+        if tasks[i - 1].status == Status.DOTTED:
+            return acted_index, False
+    # No dot above means the root was completed; the backward walk has
+    # already proven everything above is clean, so only the suffix from
+    # acted_index on can still hold dots.
+    for j in range(acted_index - 1, len(tasks)):
+        t = tasks[j]
+        if t.status == Status.DOTTED:
+            t.status = Status.OPEN
+    return None, True
 
 
 def ensure_root_dotted(tasks: List[Task]) -> Optional[int]:
@@ -60,16 +97,28 @@ def ensure_root_dotted(tasks: List[Task]) -> Optional[int]:
     ridx = first_live_index(tasks)
     if ridx is None:
         return None
-    if tasks[ridx - 1].status != "dotted":
-        tasks[ridx - 1].status = "dotted"
+    if tasks[ridx - 1].status != Status.DOTTED:
+        tasks[ridx - 1].status = Status.DOTTED
     return ridx
 
 
 def shuffle_tasks(tasks: List[Task]) -> None:
     """Shuffle live tasks in-place; done tasks moved to end, dots cleared."""
-    live = [t for t in tasks if t.status != "done"]
-    done = [t for t in tasks if t.status == "done"]
-    random.shuffle(live)
-    tasks.clear()
-    tasks.extend(live + done)
-    clear_all_dots(tasks)
+    # One pass: compact live tasks to the front (clearing dots as we go)
+    # and collect done tasks for the tail.
+    n = 0
+    done: List[Task] = []
+    for t in tasks:
+        if t.status == Status.DONE:
+            done.append(t)
+        else:
+            if t.status == Status.DOTTED:
+                t.status = Status.OPEN
+            tasks[n] = t
+            n += 1
+    tasks[n:] = done
+    # Fisher-Yates over the live prefix; random.shuffle has no stop arg.
+    randrange = random.randrange
+    for i in range(n - 1, 0, -1):
+        j = randrange(i + 1)
+        tasks[i], tasks[j] = tasks[j], tasks[i]
@@ -2,8 +2,7 @@
 
 import os
 import re
-from dataclasses import dataclass
-from typing import Literal
+from enum import IntEnum
 
 DEFAULT_DIR = os.path.expanduser("~/.fvp")
 DEFAULT_LIST = "default"
@@ -16,12 +15,41 @@ def list_path(name: str) -> str:
 STATE_RE = re.compile(r"^#\s*FVP_STATE\s+last_did=(\-?\d+)\s*$")
 TASK_RE = re.compile(r"^\s*\[(.?)\]\s*(.*\S)?\s*$")
 
-TaskStatus = Literal["open", "dotted", "done"]
+class Status(IntEnum):
+    """Task status.
+
+    Int-valued so hot loops compare statuses with a C-level int op and
+    the marker/prefix tables can be tuples indexed by status.
+    """
+
+    OPEN = 0
+    DOTTED = 1
+    DONE = 2
 
 
-@dataclass
 class Task:
-    """A single FVP task with text and status."""
+    """A single FVP task with text and status.
+
+    Uses __slots__ instead of a dataclass: no per-instance __dict__, so
+    large lists stay compact and attribute access is a C-level slot load.
+
+    `text_lower` caches `text.lower()` for filtering; callers that assign
+    `text` directly must refresh it.
+    """
+
+    __slots__ = ("text", "status", "text_lower")
+
+    def __init__(self, text: str, status: Status) -> None:
+        self.text = text
+        self.status = status
+        lower = text.lower()
+        # Reuse the original str when already lowercase (the common case).
+        self.text_lower = text if lower == text else lower
+
+    def __repr__(self) -> str:
+        return f"Task(text={self.text!r}, status={self.status!r})"
 
-    text: str
-    status: TaskStatus  # "open" | "dotted" | "done"
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.text == other.text and self.status == other.status
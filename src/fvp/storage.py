@@ -1,9 +1,93 @@
 """File I/O for FVP task lists."""
 
+import mmap
 import os
-from typing import List, Optional, Tuple
+import sys
+from typing import Iterable, List, Optional, Tuple
 
-from .models import Task, STATE_RE, TASK_RE, DEFAULT_DIR
+from .models import Status, Task, TASK_RE, DEFAULT_DIR
+
+# Well-formed task lines always start with one of these 3-byte markers, so the
+# hot parse path classifies on a fixed prefix and only decodes the text tail.
+_STATUS_BY_PREFIX = {
+    b"[ ]": Status.OPEN,
+    b"[.]": Status.DOTTED,
+    b"[x]": Status.DONE,
+    b"[X]": Status.DONE,
+}
+_STATUS_BY_STR_PREFIX = {
+    "[ ]": Status.OPEN,
+    "[.]": Status.DOTTED,
+    "[x]": Status.DONE,
+    "[X]": Status.DONE,
+}
+
+
+def _intern_text(text: str) -> str:
+    """Intern short task texts so repeated labels share one str object."""
+    return sys.intern(text) if len(text) < 64 else text
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Tuple[Optional[int], List[Task]]:
+    """Parse an iterable of newline-free byte lines into (last_did, tasks)."""
+    last_did = None
+    tasks: List[Task] = []
+
+    first = True
+    for raw in lines:
+        if first:
+            first = False
+            if raw.startswith(b"# FVP_STATE"):
+                if raw.startswith(b"# FVP_STATE last_did="):
+                    # Canonical header: parse the integer tail directly
+                    # (int() tolerates surrounding whitespace and \r).
+                    tail = raw[21:]
+                else:
+                    # Loose header (extra spacing): split on the key
+                    # instead of a regex, so no Match object is built.
+                    tail = raw.partition(b"last_did=")[2]
+                try:
+                    val = int(tail)
+                except ValueError:
+                    continue
+                last_did = None if val < 1 else val
+                continue
+        status = _STATUS_BY_PREFIX.get(raw[:3])
+        if status is not None:
+            tasks.append(Task(_intern_text(raw[3:].decode("utf-8").strip()), status))
+            continue
+        # Indented lines: strip and retry the prefix dispatch before
+        # resorting to the regex, which only sees truly malformed lines.
+        line = raw.decode("utf-8").strip()
+        if not line:
+            continue
+        status = _STATUS_BY_STR_PREFIX.get(line[:3])
+        if status is not None:
+            tasks.append(Task(_intern_text(line[3:].strip()), status))
+            continue
+        m = TASK_RE.match(line)
+        if not m:
+            tasks.append(Task(_intern_text(line.strip()), Status.OPEN))
+            continue
+        mark, text = m.group(1), _intern_text((m.group(2) or "").strip())
+        if mark in ("x", "X"):
+            tasks.append(Task(text, Status.DONE))
+        elif mark == ".":
+            tasks.append(Task(text, Status.DOTTED))
+        else:
+            tasks.append(Task(text, Status.OPEN))
+
+    return last_did, tasks
+
+
+# Last parse per path keyed by stat fingerprint: a re-read of an
+# unchanged file costs a stat and a shallow task copy, not a parse.
+_READ_CACHE = {}  # path -> (mtime_ns, size, last_did, tasks)
+
+
+def _copy_tasks(tasks: List[Task]) -> List[Task]:
+    """Fresh Task objects so callers can mutate without touching the cache."""
+    return [Task(t.text, t.status) for t in tasks]
 
 
 def read_file(path: str) -> Tuple[Optional[int], List[Task]]:
@@ -15,62 +99,191 @@ def read_file(path: str) -> Tuple[Optional[int], List[Task]]:
 
     Creates the file with a default header if it does not exist.
     """
-    last_did = None
-    tasks: List[Task] = []
-
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         with open(path, "w", encoding="utf-8") as f:
             f.write("# FVP_STATE last_did=-1\n")
         return None, []
 
-    with open(path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
+    cached = _READ_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], _copy_tasks(cached[3])
 
-    if lines and lines[0].startswith("# FVP_STATE"):
-        m = STATE_RE.match(lines[0])
-        if m:
-            val = int(m.group(1))
-            last_did = None if val < 1 else val
-    else:
-        lines.insert(0, "# FVP_STATE last_did=-1\n")
+    with open(path, "rb") as f:
+        buf = f.read()
+    # splitlines (one C call) also handles \r\n and drops the trailing
+    # empty chunk that split(b"\n") would yield.
+    last_did, tasks = _parse_lines(buf.splitlines())
+    _READ_CACHE[path] = (st.st_mtime_ns, st.st_size, last_did, _copy_tasks(tasks))
+    return last_did, tasks
 
-    for line in lines[1:]:
-        line = line.rstrip("\n")
-        if not line.strip():
-            continue
-        m = TASK_RE.match(line)
-        if not m:
-            tasks.append(Task(text=line.strip(), status="open"))
-            continue
-        mark, text = m.group(1), (m.group(2) or "").strip()
-        if mark in ("x", "X"):
-            tasks.append(Task(text=text, status="done"))
-        elif mark == ".":
-            tasks.append(Task(text=text, status="dotted"))
-        else:
-            tasks.append(Task(text=text, status="open"))
 
-    return last_did, tasks
+def _iter_mmap_lines(mm: mmap.mmap) -> Iterable[bytes]:
+    """Yield newline-free byte lines from a memory-mapped file."""
+    start = 0
+    size = len(mm)
+    while start < size:
+        nl = mm.find(b"\n", start)
+        if nl < 0:
+            yield mm[start:]
+            break
+        yield mm[start:nl]
+        start = nl + 1
+
 
+def read_file_mmap(path: str) -> Tuple[Optional[int], List[Task]]:
+    """Read-only variant of read_file backed by mmap.
 
-def write_file(path: str, last_did: Optional[int], tasks: List[Task]) -> None:
-    """Rewrite the file from in-memory state (header + tasks)."""
-    with open(path, "w", encoding="utf-8") as f:
-        header_val = last_did if (last_did and 1 <= last_did <= len(tasks)) else -1
-        f.write(f"# FVP_STATE last_did={header_val}\n")
-        for t in tasks:
-            if t.status == "open":
-                f.write(f"[ ] {t.text}\n")
-            elif t.status == "dotted":
-                f.write(f"[.] {t.text}\n")
-            else:
-                f.write(f"[x] {t.text}\n")
+    Lets the kernel page in only what the scan touches instead of copying
+    the whole file into a Python buffer. Never creates or modifies the
+    file; a missing or empty file reads as (None, []).
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None, []
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            return None, []
+        mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+        try:
+            return _parse_lines(_iter_mmap_lines(mm))
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+_HEADER_FMT = b"# FVP_STATE last_did=%d\n"
+_PREFIX_BYTES = (b"[ ] ", b"[.] ", b"[x] ")  # indexed by Status
+
+# Payload of the last write per path, so a rewrite of byte-identical
+# content (e.g. a reset with no dots set) is skipped. Only honored when
+# the on-disk file still carries the stat fingerprint of that write.
+_LAST_WRITTEN = {}
+
+
+def write_file(
+    path: str, last_did: Optional[int], tasks: List[Task], durable: bool = False
+) -> None:
+    """Rewrite the file from in-memory state (header + tasks).
+
+    The rename makes the swap atomic either way; `durable=True` adds an
+    fsync so the payload survives power loss, at the cost of a blocking
+    flush per save.
+    """
+    header_val = last_did if (last_did and 1 <= last_did <= len(tasks)) else -1
+    parts = [_HEADER_FMT % header_val]
+    append = parts.append  # avoid an attribute lookup per task
+    prefix = _PREFIX_BYTES
+    for t in tasks:
+        append(prefix[t.status] + t.text.encode("utf-8") + b"\n")
+    payload = b"".join(parts)
+    if _LAST_WRITTEN.get(path) == payload:
+        # Identical to our last write -- but only skip if the file on
+        # disk is provably still that write (an external edit bumps the
+        # stat fingerprint recorded in _READ_CACHE and must not be
+        # clobber-proofed into staying there).
+        cached = _READ_CACHE.get(path)
+        if cached is not None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if (
+                st is not None
+                and cached[0] == st.st_mtime_ns
+                and cached[1] == st.st_size
+            ):
+                return
+    # Write the whole payload to a sibling temp file and rename it into
+    # place: one write, one atomic swap, and no torn file on a crash.
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _LAST_WRITTEN[path] = payload
+    # The written state is exactly what a re-read would parse.
+    st = os.stat(path)
+    normalized_last = header_val if header_val >= 1 else None
+    _READ_CACHE[path] = (st.st_mtime_ns, st.st_size, normalized_last, _copy_tasks(tasks))
+
+
+def append_task(path: str, task: Task) -> None:
+    """Append one task line in place: O(1) I/O instead of a full rewrite.
+
+    Adding a task never changes the header, so only the new line needs to
+    reach the disk. The file must already exist (ensure_file_exists).
+    """
+    with open(path, "r+b") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            # Repair a missing trailing newline from a hand-edited file.
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(_PREFIX_BYTES[task.status] + task.text.encode("utf-8") + b"\n")
+    _LAST_WRITTEN.pop(path, None)
+    _READ_CACHE.pop(path, None)
+
+
+def clean_file(path: str) -> None:
+    """Remove crossed-out lines with a single streaming byte filter.
+
+    Copies surviving lines as-is to a temp file (no Task objects, no
+    decode/re-encode) and swaps it into place. The scanning state header
+    is reset, matching `clean` semantics.
+    """
+    tmp = path + ".tmp"
+    with open(path, "rb") as fi, open(tmp, "wb") as fo:
+        fo.write(b"# FVP_STATE last_did=-1\n")
+        first = True
+        for line in fi:
+            if first:
+                first = False
+                if line.startswith(b"# FVP_STATE"):
+                    continue
+            s = line.lstrip()
+            if not s.strip():
+                continue
+            if s.startswith((b"[x]", b"[X]")):
+                continue
+            fo.write(line)
+    os.replace(tmp, path)
+    # The file changed behind write_file's back; drop its fingerprints.
+    _LAST_WRITTEN.pop(path, None)
+    _READ_CACHE.pop(path, None)
+
+
+# Directories already created (or found) this process; repeat ensures
+# skip the abspath/stat/makedirs work entirely.
+_ENSURED_DIRS = set()
+
+
+def _ensure_parent_dir(path: str) -> None:
+    """Create the parent directory of `path` once per process."""
+    parent = os.path.dirname(os.path.abspath(path))
+    if parent and parent not in _ENSURED_DIRS:
+        # mkdir-first: one syscall in both the exists and created cases;
+        # makedirs only runs when intermediate directories are missing.
+        try:
+            os.mkdir(parent)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(parent, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
 
 
 def append_to_archive(archive_path: str, text: str) -> None:
     """Append a completed task to the archive sidecar file."""
     try:
-        os.makedirs(os.path.dirname(os.path.abspath(archive_path)), exist_ok=True)
+        _ensure_parent_dir(archive_path)
         with open(archive_path, "a", encoding="utf-8") as f:
             f.write(f"[x] {text}\n")
     except Exception:
@@ -78,27 +291,82 @@ def append_to_archive(archive_path: str, text: str) -> None:
         pass
 
 
+# Files already seen to exist this process, mirroring _ENSURED_DIRS:
+# repeat ensures skip the exists check. Nothing in-process deletes list
+# files, so a cached entry never goes stale.
+_ENSURED_FILES = set()
+
+
 def ensure_file_exists(path: str) -> None:
     """Ensure the directory and file exist with valid header."""
-    parent = os.path.dirname(os.path.abspath(path))
-    if parent:
-        os.makedirs(parent, exist_ok=True)
-    if not os.path.exists(path):
-        with open(path, "w", encoding="utf-8") as f:
+    if path in _ENSURED_FILES:
+        return
+    _ensure_parent_dir(path)
+    # Create-if-absent in one syscall instead of exists-then-open; O_EXCL
+    # fails cleanly when the file is already there, with no pre-stat race.
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o644)
+    except FileExistsError:
+        pass
+    else:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
             f.write("# FVP_STATE last_did=-1\n")
+    _ENSURED_FILES.add(path)
 
 
 def ensure_dir_exists() -> None:
     """Ensure the ~/.fvp directory exists."""
-    os.makedirs(DEFAULT_DIR, exist_ok=True)
+    if DEFAULT_DIR not in _ENSURED_DIRS:
+        try:
+            os.mkdir(DEFAULT_DIR)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(DEFAULT_DIR, exist_ok=True)
+        _ENSURED_DIRS.add(DEFAULT_DIR)
+
+
+def count_tasks(path: str) -> Tuple[int, int]:
+    """Return (live, total) task counts with a streaming byte scan.
+
+    The list picker and `fvp lists` only need counts, so this skips
+    building Task objects entirely: one pass over raw lines, classifying
+    crossed-out tasks by prefix. Mirrors _parse_lines' tolerance for
+    indented and malformed lines (both count as live).
+    """
+    live = 0
+    total = 0
+    with open(path, "rb") as f:
+        first = True
+        for line in f:
+            if first:
+                first = False
+                if line.startswith(b"# FVP_STATE"):
+                    continue
+            s = line.strip()
+            if not s:
+                continue
+            total += 1
+            if not s.startswith((b"[x]", b"[X]")):
+                live += 1
+    return live, total
 
 
 def get_available_lists() -> List[str]:
     """Return list of available list names (without .fvp extension)."""
-    if not os.path.isdir(DEFAULT_DIR):
-        return []
     names = []
-    for fname in os.listdir(DEFAULT_DIR):
-        if fname.endswith(".fvp") and not fname.endswith(".fvp.archive"):
-            names.append(fname[:-4])  # strip .fvp
+    try:
+        with os.scandir(DEFAULT_DIR) as it:
+            for entry in it:
+                fname = entry.name
+                # is_file() reads the cached dirent type; it only falls
+                # back to a stat on filesystems that report DT_UNKNOWN.
+                if (
+                    fname.endswith(".fvp")
+                    and not fname.endswith(".fvp.archive")
+                    and entry.is_file()
+                ):
+                    names.append(fname[:-4])  # strip .fvp
+    except FileNotFoundError:
+        return []
     return sorted(names)
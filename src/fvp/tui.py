@@ -1,13 +1,17 @@
 """FVP curses-based terminal user interface."""
 
 import curses
+import curses.panel
 import curses.textpad
 import curses.ascii as ascii
 import os
+from bisect import bisect_left
+from pathlib import PurePath
 from typing import List, Optional, Tuple
 
-from .models import Task, DEFAULT_DIR, DEFAULT_LIST, list_path
+from .models import Status, Task, DEFAULT_DIR, DEFAULT_LIST, list_path
 from .storage import (
+    count_tasks,
     read_file,
     write_file,
     append_to_archive,
@@ -22,6 +26,7 @@ from .core import (
     clear_all_dots,
     finish_effects_after_action,
     ensure_root_dotted,
+    index_tasks,
     shuffle_tasks,
 )
 
@@ -41,9 +46,6 @@ HELP_TEXT = [
 
 def pick_list(stdscr) -> Optional[str]:
     """Curses-based list picker. Returns list name or None if cancelled."""
-    curses.curs_set(0)
-    stdscr.keypad(True)
-
     lists = get_available_lists()
     if not lists:
         # No lists exist - return default to create it
@@ -53,8 +55,14 @@ def pick_list(stdscr) -> Optional[str]:
         # Only one list - use it directly
         return lists[0]
 
-    # Multiple lists - show picker
+    # Multiple lists - show picker; only now touch terminal state
+    # (TUI.__init__ does its own curs_set/keypad for the bypass paths).
+    curses.curs_set(0)
+    stdscr.keypad(True)
     cursor = 0
+    # Live counts per path keyed by stat fingerprint, so scrolling the
+    # picker re-reads a file only when it actually changed on disk.
+    counts = {}  # path -> (mtime_ns, info)
     while True:
         stdscr.erase()
         height, width = stdscr.getmaxyx()
@@ -73,9 +81,14 @@ def pick_list(stdscr) -> Optional[str]:
             idx = scroll + i
             path = list_path(name)
             try:
-                _, tasks = read_file(path)
-                live = sum(1 for t in tasks if t.status != "done")
-                info = f"{live} live"
+                mtime = os.stat(path).st_mtime_ns
+                cached = counts.get(path)
+                if cached is not None and cached[0] == mtime:
+                    info = cached[1]
+                else:
+                    live, _ = count_tasks(path)
+                    info = f"{live} live"
+                    counts[path] = (mtime, info)
             except Exception:
                 info = "?"
 
@@ -123,13 +136,15 @@ def prompt_new_list_name(stdscr) -> Optional[str]:
     edit.keypad(True)
     tb = curses.textpad.Textbox(edit, insert_mode=True)
 
-    cancelled = {"value": False}
+    cancelled = False
 
     def validator(ch: int) -> int:
+        # nonlocal bool: no dict hashing per keystroke.
+        nonlocal cancelled
         if ch in (10, 13):
             return ascii.BEL
         if ch == 27:
-            cancelled["value"] = True
+            cancelled = True
             return ascii.BEL
         if ch in (curses.KEY_BACKSPACE, 127, 8):
             return ascii.BS
@@ -138,7 +153,7 @@ def prompt_new_list_name(stdscr) -> Optional[str]:
     s = tb.edit(validator)
     curses.curs_set(0)
 
-    if cancelled["value"]:
+    if cancelled:
         return None
 
     s = (s or "").strip()
@@ -147,15 +162,76 @@ def prompt_new_list_name(stdscr) -> Optional[str]:
     return s if s else None
 
 
+# Parsed once so main()'s list-name check is a parts comparison.
+_DEFAULT_DIR_PATH = PurePath(DEFAULT_DIR)
+
+# Display marker per status: one tuple index per row in draw().
+_MARKER = ("[ ]", "[.]", "[x]")  # indexed by Status
+
+# Sentinel row for the horizontal rule, compared by identity in draw().
+_HLINE_ROW = ("\x00hline", 0)
+
+# Movement keys dispatch to _coalesce_moves rather than the keymap.
+_MOVE_KEYS = frozenset(
+    (curses.KEY_UP, ord("k"), curses.KEY_DOWN, ord("j"), curses.KEY_PPAGE, curses.KEY_NPAGE)
+)
+
+
+def _elide(s: str, limit: int) -> str:
+    """Truncate `s` to `limit` characters with a trailing ellipsis."""
+    if len(s) <= limit:
+        return s
+    return s[: max(limit - 1, 0)] + ("..." if limit > 0 else "")
+
+
 class TUI:
     """Curses TUI for managing a single FVP text file."""
 
+    # Key dispatch: one dict lookup per keystroke instead of an elif
+    # ladder. Movement and quit keys are handled inline in run().
+    _KEYMAP = {
+        ord("g"): "jump_top",
+        ord("G"): "jump_bottom",
+        ord("t"): "jump_root",
+        ord("n"): "jump_do_now",
+        ord("a"): "add_task",
+        ord("e"): "edit_task",
+        ord("d"): "mark_done",
+        ord("D"): "archive_done",
+        ord("S"): "stop_and_readd",
+        ord("s"): "trigger_scan",
+        ord("r"): "reset_dots",
+        ord("c"): "clean_done",
+        ord("X"): "shuffle_list",
+        ord("R"): "reload",
+        ord("/"): "filter_mode",
+        ord("h"): "toggle_hide_done",
+        ord("M"): "toggle_strict_mode",
+        ord("?"): "help_popup",
+    }
+    # Ignored while strict mode holds the user in focus on one task.
+    _FOCUS_BLOCKED = frozenset(
+        (
+            "jump_top",
+            "jump_bottom",
+            "jump_root",
+            "jump_do_now",
+            "edit_task",
+            "trigger_scan",
+            "reset_dots",
+            "clean_done",
+        )
+    )
+    # Only meaningful outside strict mode.
+    _FREE_ONLY = frozenset(("filter_mode", "toggle_hide_done"))
+
     def __init__(self, stdscr, path: str, list_name: Optional[str] = None):
         self.stdscr = stdscr
         self.path = path
         self.list_name = list_name  # For display in header
         self.last_did, self.tasks = read_file(self.path)
         self.archive_path = self.path + ".archive"
+        self._header = f"FVP: {list_name}" if list_name else "FVP"
         self.cursor = 1
         self.scroll = 0
         self.filter_text = ""
@@ -167,6 +243,28 @@ class TUI:
         self.focus_idx: Optional[int] = None
         self.focus_only_one: bool = False
         self.skip_in_scan: Optional[int] = None  # Index to skip in next scan (stopped task)
+        # Cached O(n) index scans, recomputed lazily after mutations so
+        # draw() does not rescan the task list on every keypress.
+        self._cache_dirty = True
+        self._root_idx: Optional[int] = None
+        self._last_dot_idx: Optional[int] = None
+        self._prev_dot_idx: Optional[int] = None
+        # Visible-index cache: the filter/hide-done pass over all tasks
+        # reruns only after a mutation or a view-flag change, not per frame.
+        self._indices: List[int] = []
+        self._indices_key: Tuple[int, str, bool] = (-1, "", False)
+        self._indices_dirty = True
+        # Differential rendering: what each screen row showed last frame,
+        # so draw() only re-emits rows whose text or attributes changed.
+        self._prev_rendered: List[Tuple[str, int]] = []
+        # Write batching: actions mark state dirty and write through
+        # immediately, except inside scan() which defers to one flush.
+        self._dirty = False
+        self._scan_batch = False
+        # Monotonic visible-state version; draw() is a no-op while it
+        # matches the last drawn version and the terminal size is stable.
+        self._version = 0
+        self._last_drawn_version = -1
         self.status = "Press ? for help. s to scan; a to add; d to mark done; S to stop for now."
         curses.curs_set(0)
         self.stdscr.keypad(True)
@@ -193,35 +291,134 @@ class TUI:
             self.COL_CAND = curses.A_UNDERLINE
             self.COL_BENCH = curses.A_BOLD
 
-    def draw(self):
-        """Render header, subheader, task list, and status line."""
-        self.stdscr.erase()
+        # Bind methods once so the event loop does a single dict lookup
+        # per keypress instead of walking an elif ladder.
+        self._handlers = {
+            key: (name, getattr(self, name)) for key, name in self._KEYMAP.items()
+        }
+
+    def _bump(self):
+        """Mark visible state changed so the next draw() repaints."""
+        self._version += 1
+
+    def _invalidate_cache(self):
+        """Mark the cached root/dot indices stale after a mutation."""
+        self._cache_dirty = True
+        self._indices_dirty = True
+        self._version += 1
+
+    def _save(self):
+        """Mark state dirty and write through unless a scan is batching."""
+        self._dirty = True
+        if not self._scan_batch:
+            self._flush()
+
+    def _flush(self):
+        """Write pending state to disk."""
+        if self._dirty:
+            write_file(self.path, self.last_did, self.tasks)
+            self._dirty = False
+
+    def _handle_resize(self):
+        """Refresh cached geometry once per KEY_RESIZE event.
+
+        draw() no longer polls getmaxyx per frame; the size only changes
+        when curses delivers KEY_RESIZE, so it is re-read here.
+        """
         self.height, self.width = self.stdscr.getmaxyx()
+        self._prev_rendered = []
+        self.stdscr.erase()
+        self._version += 1
+
+    def _damage_screen(self):
+        """Force a full repaint after an overlay window covered stdscr."""
+        self._prev_rendered = []
+        self._version += 1
+        self.stdscr.touchwin()
+
+    def _refresh_index_cache(self):
+        """Recompute cached root/dot indices if a mutation occurred.
+
+        One index_tasks() pass replaces the three separate traversals
+        (first_live_index, last_dotted_index, previous_dotted_above).
+        """
+        if not self._cache_dirty:
+            return
+        ix = index_tasks(self.tasks)
+        self._root_idx = ix.first_live
+        self._last_dot_idx = ix.last_dotted
+        self._prev_dot_idx = (
+            ix.previous_dotted_above(self.last_did) if self.last_did else None
+        )
+        self._cache_dirty = False
+
+    def _visible_indices(self) -> List[int]:
+        """Visible task indices under the current filter and hide flag.
+
+        Cached between frames: rebuilt only after a task mutation or when
+        the view key (task count, filter text, hide flag) changes.
+        """
+        key = (len(self.tasks), self.filter_text, self.hide_done)
+        if not self._indices_dirty and key == self._indices_key:
+            return self._indices
+        if not self.filter_text and not self.hide_done:
+            # Common case: no filter active, every task is visible.
+            indices = list(range(1, len(self.tasks) + 1))
+        else:
+            f = self.filter_text.lower()
+            hide_done = self.hide_done
+            indices = [
+                i
+                for i, t in enumerate(self.tasks, start=1)
+                if f in t.text_lower and (not hide_done or t.status != Status.DONE)
+            ]
+        self._indices = indices
+        self._indices_key = key
+        self._indices_dirty = False
+        return indices
+
+    def draw(self):
+        """Render the frame and push it to the terminal."""
+        self._compose()
+        curses.doupdate()
+
+    def _compose(self):
+        """Stage header, subheader, task list, and status line.
+
+        Rows are composed into a buffer and diffed against the previous
+        frame; only changed rows are cleared and re-emitted. Ends with
+        noutrefresh, so overlay callers can stage their own windows and
+        issue a single doupdate for the whole frame.
+        """
+        if self._version == self._last_drawn_version:
+            return
+        self._refresh_index_cache()
         self.update_status_for_phase()
 
-        header = f"FVP: {self.list_name}" if self.list_name else "FVP"
-        self.stdscr.addnstr(0, 0, header, self.width - 1, curses.A_BOLD)
+        rows: List[Tuple[str, int]] = [("", curses.A_NORMAL)] * self.height
+
+        rows[0] = (self._header, curses.A_BOLD)
 
         # Subheader: minimal in strict mode, detailed in free mode
         if self.strict_mode:
             if self.phase == "focus":
                 sub = ">>> WORK ON THIS <<<"
-            elif not self.tasks or first_live_index(self.tasks) is None:
+            elif not self.tasks or self._root_idx is None:
                 sub = "No tasks. Press 'a' to add."
             else:
                 sub = ""
         else:
             # Free mode: show technical details for debugging
             flags = []
-            root = first_live_index(self.tasks)
+            root = self._root_idx
             if root is not None:
                 flags.append(f"ROOT:{root}")
             if self.last_did:
                 flags.append(f"JUST-DID:{self.last_did}")
-                pd = previous_dotted_above(self.tasks, self.last_did)
+                pd = self._prev_dot_idx
                 if pd:
                     flags.append(f"BENCHMARK:{pd}")
-            ld = last_dotted_index(self.tasks)
+            ld = self._last_dot_idx
             if ld:
                 flags.append(f"LOWEST-DOTTED:{ld}")
             if self.filter_text:
@@ -229,7 +426,7 @@ class TUI:
             if self.hide_done:
                 flags.append("HIDE-[x]")
             sub = "  ".join(flags) if flags else "No tasks yet - press 'a' to add."
-        self.stdscr.addnstr(1, 0, sub, self.width - 1, curses.A_DIM)
+        rows[1] = (sub, curses.A_DIM)
 
         top = 2
         body_h = self.height - top - 2
@@ -253,21 +450,19 @@ class TUI:
             else:
                 indices = [cand_idx]
         else:
-            indices = []
-            f = self.filter_text.lower()
-            for i in range(1, len(self.tasks) + 1):
-                t = self.tasks[i - 1]
-                if f in t.text.lower() and (not self.hide_done or t.status != "done"):
-                    indices.append(i)
+            indices = self._visible_indices()
 
+        # indices is always ascending, so the cursor's position among the
+        # visible rows comes from one bisect instead of building a dict.
         if indices:
-            if self.cursor not in indices:
+            pos = bisect_left(indices, self.cursor)
+            if pos >= len(indices) or indices[pos] != self.cursor:
                 self.cursor = indices[0]
+                pos = 0
+            cur_pos = pos
         else:
             self.cursor = 1
-
-        visible_idx_positions = {idx: pos for pos, idx in enumerate(indices)}
-        cur_pos = visible_idx_positions.get(self.cursor, 0)
+            cur_pos = 0
         if cur_pos < self.scroll:
             self.scroll = cur_pos
         elif cur_pos >= self.scroll + body_h:
@@ -281,44 +476,80 @@ class TUI:
             if len(task_text) > self.width - 4:
                 task_text = task_text[: self.width - 7] + "..."
             y = top + (body_h // 3)  # Position task in upper third
-            self.stdscr.addnstr(y, 0, task_text.center(self.width), self.width - 1, curses.A_BOLD)
+            rows[y] = (task_text.center(self.width), curses.A_BOLD)
         else:
-            # Normal rendering with markers and indices
-            for i in range(self.scroll, min(self.scroll + body_h, len(indices))):
+            # Normal rendering with markers and indices. Bind loop-invariant
+            # attributes to locals: LOAD_FAST per row instead of LOAD_ATTR.
+            tasks = self.tasks
+            width = self.width
+            scroll = self.scroll
+            cursor = self.cursor
+            root_idx = self._root_idx
+            scan_hl = self.scan_highlight
+            cand_idx = scan_hl[0] if scan_hl else None
+            bench_idx = scan_hl[1] if scan_hl else None
+            col_cand = self.COL_CAND
+            col_bench = self.COL_BENCH
+            col_root = self.COL_ROOT
+            a_reverse = curses.A_REVERSE
+            # Base attribute per status, like the marker table: one tuple
+            # index per row instead of a branch per status.
+            base_attr = (curses.A_NORMAL, self.COL_DOTTED, curses.A_DIM)
+            # The prefix " idx. [m] " has a fixed width per frame, so the
+            # text budget is computed once instead of len(left) per row.
+            idx_w = max(4, len(str(len(tasks))))
+            avail = max(0, width - 1 - idx_w - 6)
+            marker_of = _MARKER
+            for i in range(scroll, min(scroll + body_h, len(indices))):
                 idx = indices[i]
-                t = self.tasks[idx - 1]
-                marker = "[ ]" if t.status == "open" else "[.]" if t.status == "dotted" else "[x]"
-                left = f"{idx:>4}. {marker} "
+                t = tasks[idx - 1]
+                marker = marker_of[t.status]
+                left = f"{idx:>{idx_w}}. {marker} "
                 right = t.text
-                avail = max(0, self.width - 1 - len(left))
-                if len(right) > avail:
-                    right_disp = right[: max(avail - 1, 0)] + ("..." if avail > 0 else "")
-                else:
-                    right_disp = right
+                right_disp = (
+                    right
+                    if len(right) <= avail
+                    else (right[: avail - 1] + "..." if avail > 0 else "")
+                )
                 line = left + right_disp
-                y = top + (i - self.scroll)
-                attrs = curses.A_NORMAL
-                root_idx = first_live_index(self.tasks)
-                cand_idx = self.scan_highlight[0] if self.scan_highlight else None
-                bench_idx = self.scan_highlight[1] if self.scan_highlight else None
+                y = top + (i - scroll)
+                # Scan/root highlights take precedence; those indices are
+                # always live, so they never need the done dimming.
                 if cand_idx == idx:
-                    attrs |= self.COL_CAND
+                    attrs = col_cand
                 elif bench_idx == idx:
-                    attrs |= self.COL_BENCH
+                    attrs = col_bench
                 elif root_idx == idx:
-                    attrs |= self.COL_ROOT
-                elif t.status == "dotted":
-                    attrs |= self.COL_DOTTED
-                if t.status == "done":
-                    attrs |= curses.A_DIM
-                if idx == self.cursor:
-                    attrs |= curses.A_REVERSE
-                self.stdscr.addnstr(y, 0, line, self.width - 1, attrs)
-
-        self.stdscr.hline(self.height - 2, 0, curses.ACS_HLINE, self.width)
-        self.stdscr.addnstr(self.height - 1, 0, self.status[: self.width - 1], self.width - 1)
-
-        self.stdscr.refresh()
+                    attrs = col_root
+                else:
+                    attrs = base_attr[t.status]
+                if idx == cursor:
+                    attrs |= a_reverse
+                rows[y] = (line, attrs)
+
+        rows[self.height - 2] = _HLINE_ROW
+        rows[self.height - 1] = (self.status, curses.A_NORMAL)
+
+        prev = self._prev_rendered
+        prev_n = len(prev)
+        width = self.width
+        stdscr = self.stdscr
+        for y in range(self.height):
+            cell = rows[y]
+            if y < prev_n and prev[y] == cell:
+                continue
+            try:
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+                if cell is _HLINE_ROW:
+                    stdscr.hline(y, 0, curses.ACS_HLINE, width)
+                elif cell[0]:
+                    stdscr.addnstr(y, 0, cell[0], width - 1, cell[1])
+            except curses.error:
+                pass
+        self._prev_rendered = rows
+        self._last_drawn_version = self._version
+        self.stdscr.noutrefresh()
 
     def prompt(self, prompt: str, initial: str = "") -> Optional[str]:
         """Inline text input (Enter submits, ESC cancels)."""
@@ -337,13 +568,15 @@ class TUI:
         edit.refresh()
         tb = curses.textpad.Textbox(edit, insert_mode=True)
 
-        cancelled = {"value": False}
+        cancelled = False
 
         def validator(ch: int) -> int:
+            # nonlocal bool: no dict hashing per keystroke.
+            nonlocal cancelled
             if ch in (10, 13):
                 return ascii.BEL
             if ch == 27:
-                cancelled["value"] = True
+                cancelled = True
                 return ascii.BEL
             if ch in (curses.KEY_BACKSPACE, 127, 8):
                 return ascii.BS
@@ -353,7 +586,8 @@ class TUI:
 
         s = tb.edit(validator)
         curses.curs_set(0)
-        if cancelled["value"]:
+        self._damage_screen()
+        if cancelled:
             return None
         s = (s or "").strip()
         if s == "":
@@ -368,16 +602,18 @@ class TUI:
         self.stdscr.refresh()
         ch = self.stdscr.getch()
         curses.curs_set(0)
+        self._damage_screen()
         if default_no:
             return chr(ch).lower() in ("y",)
         return chr(ch).lower() not in ("n", "\x1b")
 
     def message(self, text: str):
         self.status = text
+        self._bump()
 
     def update_status_for_phase(self):
         """Set status bar message based on current phase."""
-        if not self.tasks or first_live_index(self.tasks) is None:
+        if not self.tasks or self._root_idx is None:
             self.status = "No tasks. Press 'a' to add a task."
             return
 
@@ -399,23 +635,60 @@ class TUI:
         """Reload tasks from disk."""
         self.last_did, self.tasks = read_file(self.path)
         self.skip_in_scan = None
+        self._invalidate_cache()
         self.message("Reloaded from disk.")
 
+    def _coalesce_moves(self, first: int) -> int:
+        """Sum queued movement keys into one cursor delta.
+
+        Under key-repeat the input queue fills faster than frames render;
+        draining it here collapses a burst into one move and one redraw.
+        A queued non-movement key is pushed back for the main loop.
+        """
+        page = self.height - 5
+        deltas = {
+            curses.KEY_UP: -1,
+            ord("k"): -1,
+            curses.KEY_DOWN: 1,
+            ord("j"): 1,
+            curses.KEY_PPAGE: -page,
+            curses.KEY_NPAGE: page,
+        }
+        delta = deltas[first]
+        self.stdscr.nodelay(True)
+        try:
+            while True:
+                ch = self.stdscr.getch()
+                if ch == -1:
+                    break
+                d = deltas.get(ch)
+                if d is None:
+                    curses.ungetch(ch)
+                    break
+                delta += d
+        finally:
+            self.stdscr.nodelay(False)
+        return delta
+
     def move_cursor(self, delta: int):
         if not self.tasks:
             return
         self.cursor = max(1, min(len(self.tasks), self.cursor + delta))
+        self._bump()
 
     def jump_top(self):
         if self.tasks:
             self.cursor = 1
+            self._bump()
 
     def jump_bottom(self):
         if self.tasks:
             self.cursor = len(self.tasks)
+            self._bump()
 
     def jump_root(self):
-        ridx = first_live_index(self.tasks)
+        self._refresh_index_cache()
+        ridx = self._root_idx
         if ridx:
             self.cursor = ridx
             self.message(f"Jumped to root: {ridx}.")
@@ -423,9 +696,10 @@ class TUI:
     def jump_do_now(self):
         if not self.tasks:
             return
-        ld = last_dotted_index(self.tasks)
+        self._refresh_index_cache()
+        ld = self._last_dot_idx
         if self.last_did:
-            bench = previous_dotted_above(self.tasks, self.last_did)
+            bench = self._prev_dot_idx
             target = ld if (ld and (ld > self.last_did)) else bench or ld
         else:
             target = ld
@@ -440,8 +714,9 @@ class TUI:
         if s is None or not s.strip():
             self.message("Add cancelled.")
             return
-        self.tasks.append(Task(text=s.strip(), status="open"))
-        write_file(self.path, self.last_did, self.tasks)
+        self.tasks.append(Task(text=s.strip(), status=Status.OPEN))
+        self._invalidate_cache()
+        self._save()
         self.cursor = len(self.tasks)
         self.message(f"Added: {s.strip()}")
 
@@ -454,16 +729,19 @@ class TUI:
             self.message("Edit cancelled.")
             return
         t.text = s.strip()
-        write_file(self.path, self.last_did, self.tasks)
+        t.text_lower = t.text.lower()
+        self._invalidate_cache()
+        self._save()
         self.message(f"Edited {self.cursor}.")
 
     def mark_done(self):
         if not self.tasks:
             return
         idx = self.cursor
-        self.tasks[idx - 1].status = "done"
+        self.tasks[idx - 1].status = Status.DONE
         self.last_did, cleared = finish_effects_after_action(self.tasks, idx)
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.message(f"Marked done: {idx}. {'(root finished -> dots reset)' if cleared else ''}")
         if self.strict_mode:
             self.phase = "idle"
@@ -475,12 +753,13 @@ class TUI:
             return
         idx = self.cursor
         text = self.tasks[idx - 1].text
-        self.tasks[idx - 1].status = "done"
-        self.tasks.append(Task(text=text, status="open"))
+        self.tasks[idx - 1].status = Status.DONE
+        self.tasks.append(Task(text=text, status=Status.OPEN))
         self.last_did, cleared = finish_effects_after_action(self.tasks, idx)
         # Track the new task index so we skip it in the next scan
         self.skip_in_scan = len(self.tasks)
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.cursor = len(self.tasks)
         self.message(
             f"Stopped for now and re-added: {idx} -> {len(self.tasks)}. "
@@ -495,7 +774,8 @@ class TUI:
         clear_all_dots(self.tasks)
         self.last_did = None
         self.skip_in_scan = None
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.message("Cleared dots & scanning state.")
         if self.strict_mode:
             self.phase = "idle"
@@ -508,10 +788,11 @@ class TUI:
         if not self.confirm("Remove all crossed-out [x] lines?"):
             self.message("Clean cancelled.")
             return
-        self.tasks = [t for t in self.tasks if t.status != "done"]
+        self.tasks = [t for t in self.tasks if t.status != Status.DONE]
         self.last_did = None
         self.skip_in_scan = None
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.cursor = min(self.cursor, len(self.tasks)) if self.tasks else 1
         self.message("Removed crossed-out tasks. (Scanning state reset.)")
         if self.strict_mode:
@@ -521,7 +802,7 @@ class TUI:
 
     def shuffle_list(self):
         """Shuffle live tasks with confirmation."""
-        live_count = sum(1 for t in self.tasks if t.status != "done")
+        live_count = sum(1 for t in self.tasks if t.status != Status.DONE)
         if live_count < 2:
             self.message("Not enough live tasks to shuffle.")
             return
@@ -531,7 +812,8 @@ class TUI:
         shuffle_tasks(self.tasks)
         self.last_did = None
         self.skip_in_scan = None
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.cursor = 1
         self.message(f"Shuffled {live_count} live tasks.")
         if self.strict_mode:
@@ -544,7 +826,7 @@ class TUI:
             return
         idx = self.cursor
         text = self.tasks[idx - 1].text
-        self.tasks[idx - 1].status = "done"
+        self.tasks[idx - 1].status = Status.DONE
         new_last, cleared = finish_effects_after_action(self.tasks, idx)
         append_to_archive(self.archive_path, text)
         del self.tasks[idx - 1]
@@ -552,7 +834,8 @@ class TUI:
             self.last_did = None
         else:
             self.last_did = min(idx - 1, len(self.tasks)) if (idx - 1) >= 1 else None
-        write_file(self.path, self.last_did, self.tasks)
+        self._invalidate_cache()
+        self._save()
         self.cursor = min(idx, len(self.tasks)) if self.tasks else 1
         self.message(f"Archived and removed task. {'(root finished -> dots reset)' if cleared else ''}")
         if self.strict_mode:
@@ -569,6 +852,29 @@ class TUI:
         self.filter_text = s
         self.message(f"Filter: /{self.filter_text}")
 
+    def trigger_scan(self):
+        if self.strict_mode:
+            self.phase = "idle"  # Trigger auto-scan on next iteration
+            self._bump()
+        else:
+            self.scan()
+
+    def toggle_hide_done(self):
+        self.hide_done = not self.hide_done
+        self.message("Hide crossed-out ON." if self.hide_done else "Hide crossed-out OFF.")
+
+    def toggle_strict_mode(self):
+        self.strict_mode = not self.strict_mode
+        self.phase = "idle"
+        self.focus_idx = None
+        self.focus_only_one = False
+        if self.strict_mode:
+            self.hide_done = True
+            self.filter_text = ""
+            self.message("Strict mode ON. Guided flow enabled.")
+        else:
+            self.message("Strict mode OFF. Free navigation.")
+
     def help_popup(self):
         h, w = self.height, self.width
         win_h = min(len(HELP_TEXT) + 2, h - 2)
@@ -578,55 +884,115 @@ class TUI:
         for i, line in enumerate(HELP_TEXT[: win_h - 2], start=1):
             win.addnstr(i, 2, line, win_w - 4)
         win.addnstr(win_h - 1, 2, "Press any key...", win_w - 4, curses.A_DIM)
-        win.refresh()
+        # Stack the popup as a panel: hiding it restores the covered
+        # region from stdscr, so no full repaint is needed on close.
+        panel = curses.panel.new_panel(win)
+        curses.panel.update_panels()
+        curses.doupdate()
         win.getch()
+        panel.hide()
+        curses.panel.update_panels()
+        curses.doupdate()
 
     def scan(self) -> Optional[int]:
-        """Run the dot-chain pass and return the 'Do now' index."""
+        """Run the dot-chain pass and return the 'Do now' index.
+
+        Mutations during the pass (dots, adds, shuffles) mark state dirty;
+        one flush writes the file when the pass ends instead of rewriting
+        it per answer.
+        """
+        self._scan_batch = True
+        try:
+            return self._scan_pass()
+        finally:
+            self._scan_batch = False
+            self._flush()
+
+    def _scan_candidates(self, start: int) -> List[int]:
+        """Live task indices from `start` on, minus the just-stopped task.
+
+        Built once per pass so the ask loop iterates only real candidates
+        instead of stepping over every crossed-out entry.
+        """
+        tasks = self.tasks
+        skip = self.skip_in_scan
+        return [
+            i
+            for i in range(start, len(tasks) + 1)
+            if tasks[i - 1].status != Status.DONE and i != skip
+        ]
+
+    def _scan_pass(self) -> Optional[int]:
+        """Body of scan(); assumes write batching is active."""
         if not self.tasks or first_live_index(self.tasks) is None:
             self.message("No live tasks to scan.")
             return None
 
         if self.last_did and (self.last_did < 1 or self.last_did > len(self.tasks)):
             self.last_did = None
+            self._invalidate_cache()
+
+        title = "Scan Compare"
+        prompt_text = "up/k = top, down/j = bottom, a = add, X = shuffle, q = stop"
+        # One popup window reused across comparisons instead of a newwin
+        # per question; sized once for the longest task text on screen.
+        max_text = max((len(t.text) for t in self.tasks), default=0)
+        content_w = max(len(title), max_text, len(prompt_text)) + 4
+
+        def make_popup() -> Tuple["curses.window", int]:
+            """Create the popup at the current screen geometry."""
+            w = min(max(32, content_w), max(8, self.width - 2))
+            h = min(6, max(3, self.height - 2))
+            y0 = max(1, (self.height - h) // 2)
+            x0 = max(1, (self.width - w) // 2)
+            return curses.newwin(h, w, y0, x0), w
+
+        win, win_w = make_popup()
 
         def ask_compare(i_idx: int, bench_idx: int) -> Optional[bool]:
+            nonlocal win, win_w
             self.scan_highlight = (i_idx, bench_idx)
             self.scan_only_two = True
-            self.draw()
+            self._bump()
             cand_text = self.tasks[i_idx - 1].text
             bench_text = self.tasks[bench_idx - 1].text if bench_idx else "(none)"
 
-            max_w = self.width - 2
-            title = "Scan Compare"
-            prompt_text = "up/k = top, down/j = bottom, a = add, X = shuffle, q = stop"
-
-            def elide(s: str, limit: int) -> str:
-                if len(s) <= limit:
-                    return s
-                return s[: max(limit - 1, 0)] + ("..." if limit > 0 else "")
-
-            content_w = max(len(title), len(cand_text), len(bench_text), len(prompt_text)) + 4
-            win_w = min(max(32, content_w), max_w)
-            win_h = 6
-            y0 = max(1, (self.height - win_h) // 2)
-            x0 = max(1, (self.width - win_w) // 2)
-
-            win = curses.newwin(win_h, win_w, y0, x0)
-            win.border()
-            win.addnstr(0, 2, f" {title} ", win_w - 4, curses.A_BOLD)
-            win.addnstr(1, 2, elide(bench_text, win_w - 4), win_w - 4)
-            win.addnstr(2, 2, "vs.", win_w - 4, curses.A_DIM)
-            win.addnstr(3, 2, elide(cand_text, win_w - 4), win_w - 4)
-            win.addnstr(4, 2, elide(prompt_text, win_w - 4), win_w - 4, curses.A_DIM)
-            win.refresh()
-
+            def show():
+                # Stage the base frame and the popup, then push both in
+                # one doupdate: one terminal sync per comparison. Rows
+                # beyond a cramped popup just fall off (curses.error).
+                self._compose()
+                win.erase()
+                try:
+                    win.border()
+                    win.addnstr(0, 2, f" {title} ", win_w - 4, curses.A_BOLD)
+                    win.addnstr(1, 2, _elide(bench_text, win_w - 4), win_w - 4)
+                    win.addnstr(2, 2, "vs.", win_w - 4, curses.A_DIM)
+                    win.addnstr(3, 2, _elide(cand_text, win_w - 4), win_w - 4)
+                    win.addnstr(
+                        4, 2, _elide(prompt_text, win_w - 4), win_w - 4, curses.A_DIM
+                    )
+                except curses.error:
+                    pass
+                win.noutrefresh()
+                curses.doupdate()
+
+            show()
             ch = self.stdscr.getch()
+            while ch == curses.KEY_RESIZE:
+                # The resize shrank the reused popup in place; rebuild it
+                # at the new geometry and re-stage frame plus popup so
+                # the question is visible before blocking again.
+                self._handle_resize()
+                win, win_w = make_popup()
+                show()
+                ch = self.stdscr.getch()
             try:
-                win.clear()
-                win.refresh()
+                win.erase()
+                win.noutrefresh()
             except Exception:
                 pass
+            self._damage_screen()
             self.scan_highlight = None
             self.scan_only_two = False
             self.draw()
@@ -651,31 +1017,35 @@ class TUI:
 
         if not self.last_did:
             root_idx = ensure_root_dotted(self.tasks)
+            self._invalidate_cache()
             if root_idx is None:
                 self.message("No live tasks.")
                 return None
             bench_idx = last_dotted_index(self.tasks) or root_idx
-            start_from = bench_idx + 1
-            i = start_from
-            while i <= len(self.tasks):
-                # Skip done tasks and the just-stopped task
-                if self.tasks[i - 1].status != "done" and i != self.skip_in_scan:
-                    ans = ask_compare(i, last_dotted_index(self.tasks) or bench_idx)
-                    if ans is None:
-                        cancelled = True
-                        break
-                    if ans == "add":
-                        self.add_task()
-                        continue  # Re-check same index after adding
-                    if ans == "shuffle":
-                        self.shuffle_list()
-                        return None
-                    if ans:
-                        self.tasks[i - 1].status = "dotted"
-                        dotted_any = True
-                i += 1
+            candidates = self._scan_candidates(bench_idx + 1)
+            pos = 0
+            while pos < len(candidates):
+                i = candidates[pos]
+                ans = ask_compare(i, last_dotted_index(self.tasks) or bench_idx)
+                if ans is None:
+                    cancelled = True
+                    break
+                if ans == "add":
+                    self.add_task()
+                    # Re-check same index; the new task joins the tail
+                    candidates = self._scan_candidates(i)
+                    pos = 0
+                    continue
+                if ans == "shuffle":
+                    self.shuffle_list()
+                    return None
+                if ans:
+                    self.tasks[i - 1].status = Status.DOTTED
+                    self._invalidate_cache()
+                    dotted_any = True
+                pos += 1
 
-            write_file(self.path, self.last_did, self.tasks)
+            self._save()
             if cancelled:
                 self.message("Scan stopped. Press 's' to resume, 'q' to quit.")
                 return None
@@ -692,31 +1062,36 @@ class TUI:
         if bench_idx is None:
             clear_all_dots(self.tasks)
             self.last_did = None
-            write_file(self.path, self.last_did, self.tasks)
+            self._invalidate_cache()
+            self._save()
             self.message("Dots were stale; reset. Start a fresh scan (press 's').")
             return None
 
-        i = self.last_did + 1
-        while i <= len(self.tasks):
-            # Skip done tasks and the just-stopped task
-            if self.tasks[i - 1].status != "done" and i != self.skip_in_scan:
-                ans = ask_compare(i, bench_idx)
-                if ans is None:
-                    cancelled = True
-                    break
-                if ans == "add":
-                    self.add_task()
-                    continue  # Re-check same index after adding
-                if ans == "shuffle":
-                    self.shuffle_list()
-                    return None
-                if ans:
-                    self.tasks[i - 1].status = "dotted"
-                    bench_idx = i
-                    dotted_any = True
-            i += 1
-
-        write_file(self.path, self.last_did, self.tasks)
+        candidates = self._scan_candidates(self.last_did + 1)
+        pos = 0
+        while pos < len(candidates):
+            i = candidates[pos]
+            ans = ask_compare(i, bench_idx)
+            if ans is None:
+                cancelled = True
+                break
+            if ans == "add":
+                self.add_task()
+                # Re-check same index; the new task joins the tail
+                candidates = self._scan_candidates(i)
+                pos = 0
+                continue
+            if ans == "shuffle":
+                self.shuffle_list()
+                return None
+            if ans:
+                self.tasks[i - 1].status = Status.DOTTED
+                self._invalidate_cache()
+                bench_idx = i
+                dotted_any = True
+            pos += 1
+
+        self._save()
         if cancelled:
             self.message("Scan stopped. Press 's' to resume, 'q' to quit.")
             return None
@@ -735,7 +1110,10 @@ class TUI:
             if self.strict_mode:
                 if self.filter_text:
                     self.filter_text = ""
-                self.hide_done = True
+                    self._bump()
+                if not self.hide_done:
+                    self.hide_done = True
+                    self._bump()
 
                 if self.phase in (None, "idle"):
                     self.phase = "scanning"
@@ -745,125 +1123,71 @@ class TUI:
                         self.cursor = target
                         self.phase = "focus"
                         self.focus_only_one = True
+                        self._bump()
                         continue  # Only continue when entering focus
                     else:
                         self.focus_idx = None
                         self.focus_only_one = False
                         self.phase = "waiting"  # Don't auto-restart scan
+                        self._bump()
                     # Fall through to draw/getch so user can interact
                 elif self.phase == "focus":
-                    self.focus_only_one = True
+                    if not self.focus_only_one:
+                        self.focus_only_one = True
+                        self._bump()
                 else:
-                    self.focus_only_one = False
+                    if self.focus_only_one:
+                        self.focus_only_one = False
+                        self._bump()
 
             self.draw()
             ch = self.stdscr.getch()
 
             if ch in (ord("q"), 27):
+                self._flush()
                 break
 
-            elif ch in (curses.KEY_UP, ord("k")):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.move_cursor(-1)
-            elif ch in (curses.KEY_DOWN, ord("j")):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.move_cursor(+1)
-            elif ch == curses.KEY_PPAGE:
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.move_cursor(-(self.height - 5))
-            elif ch == curses.KEY_NPAGE:
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.move_cursor(+(self.height - 5))
-            elif ch == ord("g"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.jump_top()
-            elif ch == ord("G"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.jump_bottom()
-            elif ch == ord("t"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.jump_root()
-            elif ch == ord("n"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.jump_do_now()
+            if ch == curses.KEY_RESIZE:
+                self._handle_resize()
+                continue
 
-            elif ch == ord("a"):
-                self.add_task()
-            elif ch == ord("e"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.edit_task()
-            elif ch == ord("d"):
-                self.mark_done()
-            elif ch == ord("D"):
-                self.archive_done()
-            elif ch == ord("S"):
-                self.stop_and_readd()
-
-            elif ch == ord("s"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    if self.strict_mode:
-                        self.phase = "idle"  # Trigger auto-scan on next iteration
-                    else:
-                        self.scan()
-            elif ch == ord("r"):
+            if ch in _MOVE_KEYS:
                 if not (self.strict_mode and self.phase == "focus"):
-                    self.reset_dots()
-            elif ch == ord("c"):
-                if not (self.strict_mode and self.phase == "focus"):
-                    self.clean_done()
-            elif ch == ord("X"):
-                self.shuffle_list()
-            elif ch == ord("R"):
-                self.reload()
-            elif ch == ord("/"):
-                if not self.strict_mode:
-                    self.filter_mode()
-            elif ch == ord("h"):
-                if not self.strict_mode:
-                    self.hide_done = not self.hide_done
-                    self.message("Hide crossed-out ON." if self.hide_done else "Hide crossed-out OFF.")
-            elif ch == ord("M"):
-                self.strict_mode = not self.strict_mode
-                if self.strict_mode:
-                    self.phase = "idle"
-                    self.focus_idx = None
-                    self.focus_only_one = False
-                    self.hide_done = True
-                    self.filter_text = ""
-                    self.message("Strict mode ON. Guided flow enabled.")
-                else:
-                    self.phase = "idle"
-                    self.focus_idx = None
-                    self.focus_only_one = False
-                    self.message("Strict mode OFF. Free navigation.")
-            elif ch == ord("?"):
-                self.help_popup()
-
-
-def start_curses(path: str, list_name: Optional[str] = None):
-    """Initialize curses and run TUI."""
-
-    def _main(stdscr):
-        tui = TUI(stdscr, path, list_name)
-        tui.run()
-
-    curses.wrapper(_main)
+                    self.move_cursor(self._coalesce_moves(ch))
+                continue
 
+            entry = self._handlers.get(ch)
+            if entry is None:
+                continue
+            name, handler = entry
+            if self.strict_mode:
+                if self.phase == "focus" and name in self._FOCUS_BLOCKED:
+                    continue
+                if name in self._FREE_ONLY:
+                    continue
+            handler()
 
-def start_with_picker():
-    """Start curses with list picker, then run TUI."""
 
-    def _main(stdscr):
+def _run(stdscr, path: Optional[str], list_name: Optional[str]) -> None:
+    """Shared curses body for both entry paths; picks a list when path is None."""
+    if path is None:
         list_name = pick_list(stdscr)
         if list_name is None:
             # User cancelled
             return
         path = list_path(list_name)
         ensure_file_exists(path)
-        tui = TUI(stdscr, path, list_name)
-        tui.run()
+    TUI(stdscr, path, list_name).run()
+
 
-    curses.wrapper(_main)
+def start_curses(path: str, list_name: Optional[str] = None):
+    """Initialize curses and run TUI."""
+    curses.wrapper(_run, path, list_name)
+
+
+def start_with_picker():
+    """Start curses with list picker, then run TUI."""
+    curses.wrapper(_run, None, None)
 
 
 def main(path: Optional[str] = None) -> None:
@@ -871,15 +1195,24 @@ def main(path: Optional[str] = None) -> None:
     ensure_dir_exists()
 
     if path is None:
-        # No explicit path - show picker (or use default if only one/no lists)
-        start_with_picker()
+        # Resolve the no-list and single-list cases before curses starts,
+        # so only a real choice between lists enters the picker path.
+        lists = get_available_lists()
+        if len(lists) > 1:
+            start_with_picker()
+            return
+        list_name = lists[0] if lists else DEFAULT_LIST
+        file_path = list_path(list_name)
+        ensure_file_exists(file_path)
+        start_curses(file_path, list_name)
     else:
-        # Explicit path given - extract list name if it's in ~/.fvp/
-        list_name = None
-        if path.startswith(DEFAULT_DIR) and path.endswith(".fvp"):
-            # Extract list name from path
-            basename = os.path.basename(path)
-            list_name = basename[:-4]  # strip .fvp
+        # Explicit path given - it names a list when it sits directly in
+        # ~/.fvp/; one PurePath decomposition replaces the separate
+        # prefix/suffix/basename string scans.
+        p = PurePath(path)
+        list_name = (
+            p.stem if p.suffix == ".fvp" and p.parent == _DEFAULT_DIR_PATH else None
+        )
         ensure_file_exists(path)
         start_curses(path, list_name)
 